@@ -1,49 +1,83 @@
-from flask import Flask
+from flask import Flask, current_app
 from flask_cors import CORS
 from config import Config
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
 from flask_migrate import Migrate
 from flask_socketio import SocketIO
-from authlib.integrations.flask_client import OAuth
 from flask_session import Session
 
-app = Flask(__name__)
-app.config.from_object(Config)
+# Extensions are created unbound here and attached to an app in create_app(),
+# so importing this package (CLI commands, migrations, worker spawns) stays cheap.
 
 # Server-side Session
-Session(app)
+server_session = Session()
 
 # Database
 class Base(DeclarativeBase): pass
-db = SQLAlchemy(model_class=Base, app=app)
-migrate = Migrate(app, db)
-
-client_base_url: str = str(app.config.get("CLIENT_BASE_URL"))
+db = SQLAlchemy(model_class=Base)
+migrate = Migrate()
 
 # Cors
-CORS(app, origins=[
-  client_base_url
-], supports_credentials=True)
-
-# OAuth
-oauth = OAuth(app=app)
-oauth.register("nwHacks_2026_app",
-  client_id=app.config.get("OAUTH2_CLIENT_ID"),
-  client_secret=app.config.get("OAUTH2_CLIENT_SECRET"),
-  server_metadata_url=app.config.get("OAUTH2_META_URL"),
-  client_kwargs={
-      "scope": "openid profile email",
-  }
-)
+cors = CORS()
 
 # Websocket
-socketio = SocketIO(app=app,
- logger=True,
- engineio_logger=True,
- cors_allowed_origins="*", # this is very dangerous but it's fineeeee
- async_mode='threading'
-)
-# socketio = SocketIO(app, async_mode='threading')
-
-from app import api_routes, web_socket_routes, auth_routes
+socketio = SocketIO()
+
+OAUTH_CLIENT_NAME = "nwHacks_2026_app"
+
+def create_app(config_class=Config) -> Flask:
+  app = Flask(__name__)
+  app.config.from_object(config_class)
+
+  server_session.init_app(app)
+
+  db.init_app(app)
+  migrate.init_app(app, db)
+
+  cors.init_app(app, origins=[
+    str(app.config.get("CLIENT_BASE_URL"))
+  ], supports_credentials=True)
+
+  # importing the module registers its handlers on the socketio instance
+  from app import web_socket_routes
+  socketio.init_app(app,
+    logger=app.config.get("SOCKETIO_LOGGER", False),
+    engineio_logger=app.config.get("SOCKETIO_LOGGER", False),
+    cors_allowed_origins="*", # this is very dangerous but it's fineeeee
+    async_mode='threading'
+  )
+
+  from app.api_routes import api
+  from app.auth_routes import auth
+  app.register_blueprint(api)
+  app.register_blueprint(auth)
+
+  return app
+
+# === Lazily initialized clients ===
+
+def get_oauth_client():
+  # authlib is only imported and registered the first time someone logs in
+  oauth = current_app.extensions.get("authlib.integrations.flask_client")
+  if oauth is None:
+    from authlib.integrations.flask_client import OAuth
+    oauth = OAuth(app=current_app._get_current_object()) # type: ignore
+    oauth.register(OAUTH_CLIENT_NAME,
+      client_id=current_app.config.get("OAUTH2_CLIENT_ID"),
+      client_secret=current_app.config.get("OAUTH2_CLIENT_SECRET"),
+      server_metadata_url=current_app.config.get("OAUTH2_META_URL"),
+      client_kwargs={
+          "scope": "openid profile email",
+      }
+    )
+  return oauth.create_client(OAUTH_CLIENT_NAME)
+
+def get_finnhub_client():
+  # one client (and one HTTP session) per app, created on the first price lookup
+  finnhub_client = current_app.extensions.get("finnhub")
+  if finnhub_client is None:
+    import finnhub
+    finnhub_client = finnhub.Client(current_app.config.get("FINNHUB"))
+    current_app.extensions["finnhub"] = finnhub_client
+  return finnhub_client
@@ -1,15 +1,15 @@
 import random
 
 from app.auth_routes import login_required
-from app import app, db
+from app import db, get_finnhub_client
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
-from flask import jsonify, request, session
-import finnhub
+from flask import Blueprint, jsonify, request, session
 import uuid
-from app.model import User, Strategy, OptionLeg
+from app.model import User, Strategy
+from app.serializers import option_leg_from_dict, send_payload, strategy_to_dict
 
-# print(app.config.get("OAUTH2_CLIENT_ID"))
+api = Blueprint("api", __name__, url_prefix="/api")
 
 # # TODO: delete these two later
 # @app.route("/")
@@ -17,9 +17,9 @@ from app.model import User, Strategy, OptionLeg
 # def index():
 #     return jsonify({"message": "hello"})
 
-@app.route("/api/get-price", methods=["GET"])
+@api.route("/get-price", methods=["GET"])
 def get_price():
-    finnhub_client = finnhub.Client(app.config.get("FINNHUB"))
+    finnhub_client = get_finnhub_client()
     stock_symbol = request.args.get('stock')
     if not stock_symbol:
         return jsonify({"error": "Stock symbol is required"}), 400
@@ -52,7 +52,7 @@ def get_price():
 
 # Strategies
 
-@app.route("/api/strategies", methods=["POST"])
+@api.route("/strategies", methods=["POST"])
 @login_required
 def saveStrategy():
 
@@ -79,16 +79,7 @@ def saveStrategy():
     #     "stockSymbol": stockSymbol
     # }
 
-    lol = [] # list of legs
-    for leg_dict in legs:
-        leg = OptionLeg()
-        leg.option_type = leg_dict["type"]
-        leg.position_type = leg_dict["position"]
-        leg.strike = leg_dict["strike"]
-        leg.premium = leg_dict["premium"]
-        leg.quantity = leg_dict["quantity"]
-        
-        lol.append(leg)
+    lol = [option_leg_from_dict(leg_dict) for leg_dict in legs] # list of legs
 
     strategy = Strategy()
     strategy.name = name
@@ -108,24 +99,9 @@ def saveStrategy():
 
     # print(in_memory_strategy_db)
 
-    option_legs = []
-    for option_leg in strategy.option_legs:
-        option_legs.append({
-            "type": option_leg.option_type,
-            "position": option_leg.position_type,
-            "strike": option_leg.strike,
-            "premium": option_leg.premium,
-            "quantity": option_leg.quantity,
-        })
-
-    return jsonify({
-        "id": strategy.id,
-        "name": strategy.name,
-        "legs": option_legs,
-        "stockSymbol": strategy.stock_symbol,
-    }), 201
+    return send_payload(strategy_to_dict(strategy), 201)
 
-@app.route("/api/strategies", methods=["GET"])
+@api.route("/strategies", methods=["GET"])
 @login_required
 def loadAllStrategies():
 
@@ -136,29 +112,14 @@ def loadAllStrategies():
     user = db.session.scalars(sa.select(User).where(User.email == session.get("user_token")["userinfo"]["email"])).first() # type: ignore
 
     for strategy in user.strategies: # type: ignore
-        option_legs = []
-        for option_leg in strategy.option_legs:
-            option_legs.append({
-                "type": option_leg.option_type,
-                "position": option_leg.position_type,
-                "strike": option_leg.strike,
-                "premium": option_leg.premium,
-                "quantity": option_leg.quantity,
-            })
-
-        savedStrategies.append({
-            "id": strategy.id,
-            "name": strategy.name,
-            "legs": option_legs,
-            "stockSymbol": strategy.stock_symbol,
-        })
+        savedStrategies.append(strategy_to_dict(strategy))
 
 
     # print(savedStrategies)
 
-    return jsonify(savedStrategies)
+    return send_payload(savedStrategies)
 
-@app.route("/api/strategies/<int:strategy_id>", methods=["DELETE"]) # type: ignore
+@api.route("/strategies/<int:strategy_id>", methods=["DELETE"]) # type: ignore
 @login_required
 def deleteStrategies(strategy_id: int):
     # global in_memory_strategy_db
@@ -182,7 +143,7 @@ def deleteStrategies(strategy_id: int):
 
     return jsonify({"message": "success"}), 204
 
-@app.route("/api/alerts", methods=["POST"])
+@api.route("/alerts", methods=["POST"])
 @login_required
 def observePrice():
     input_data = request.get_json()
@@ -1,9 +1,9 @@
-from app import app, oauth, db
+from app import db, get_oauth_client
 from app.model import User
-from flask import make_response, json, session, redirect, jsonify
+from flask import Blueprint, current_app, make_response, json, session, redirect, jsonify
 import sqlalchemy as sa
 
-client_base_url: str = str(app.config.get("CLIENT_BASE_URL"))
+auth = Blueprint("auth", __name__, url_prefix="/api")
 
 # === Check Authenticated Decorator Function ===
 
@@ -20,16 +20,16 @@ def login_required(endpoint_function):
 
 # === Auth Routes ===
 
-@app.route("/api/google-login", methods=["GET"])
+@auth.route("/google-login", methods=["GET"])
 def googleLogin():
-  return oauth.nwHacks_2026_app.authorize_redirect(
-    redirect_uri=app.config.get("OAUTH2_REDIRECT_URI")
+  return get_oauth_client().authorize_redirect(
+    redirect_uri=current_app.config.get("OAUTH2_REDIRECT_URI")
   )
 
-@app.route("/api/google-oauth-redirect", methods=["GET"])
+@auth.route("/google-oauth-redirect", methods=["GET"])
 def googleCallback():
   # use authlib to make request to google oauth exchanging authorization code with id and access token
-  token = oauth.nwHacks_2026_app.authorize_access_token()
+  token = get_oauth_client().authorize_access_token()
 
   # store the token in flask-session to store the user log in session
   session["user_token"] = token
@@ -48,10 +48,10 @@ def googleCallback():
 
   # create response function obj equal to redirect fn - redirect the user to the client side root page for now
   #todo: allow for different redirect routes
-  return redirect(f"{client_base_url}/options")
+  return redirect(f"{current_app.config.get('CLIENT_BASE_URL')}/options")
 
 
-@app.route("/api/logout", methods=["POST"])
+@auth.route("/logout", methods=["POST"])
 @login_required
 def logout():
   session.clear()
@@ -64,7 +64,7 @@ def logout():
   response.delete_cookie('session')
   return response
 
-@app.route("/api/me", methods=["GET"])
+@auth.route("/me", methods=["GET"])
 @login_required
 def getCurrentUserInfo():
   user_info = session.get("user_token")["userinfo"] # type: ignore
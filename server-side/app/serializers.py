@@ -0,0 +1,188 @@
+import gzip
+import json
+import math
+import sys
+import zlib
+from array import array
+
+from flask import Response, current_app, request, stream_with_context
+
+# Optional speedups, every one of them falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+
+# msgpack ext type used for numeric series: raw little-endian float64 values
+FLOAT64_ARRAY_EXT = 1
+
+# === Models ===
+
+def option_leg_to_dict(option_leg) -> dict:
+    return {
+        "type": option_leg.option_type,
+        "position": option_leg.position_type,
+        "strike": option_leg.strike,
+        "premium": option_leg.premium,
+        "quantity": option_leg.quantity,
+    }
+
+def option_leg_from_dict(leg_dict: dict):
+    from app.model import OptionLeg
+
+    leg = OptionLeg()
+    leg.option_type = leg_dict["type"]
+    leg.position_type = leg_dict["position"]
+    leg.strike = leg_dict["strike"]
+    leg.premium = leg_dict["premium"]
+    leg.quantity = leg_dict["quantity"]
+    return leg
+
+def strategy_to_dict(strategy) -> dict:
+    return {
+        "id": strategy.id,
+        "name": strategy.name,
+        "legs": [option_leg_to_dict(option_leg) for option_leg in strategy.option_legs],
+        "stockSymbol": strategy.stock_symbol,
+    }
+
+# === Encoders ===
+
+def float_series(values) -> array:
+    # wrap numeric series (price grids, histograms) in this so msgpack can pack them as one blob
+    return array("d", values)
+
+def _json_default(value):
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _finite_or_null(data):
+    # orjson writes NaN/Infinity as null, do the same so both backends produce valid JSON
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite_or_null(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple, array)):
+        return [_finite_or_null(value) for value in data]
+    return data
+
+def encode_json(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    try:
+        return json.dumps(data, default=_json_default, separators=(",", ":"), allow_nan=False).encode()
+    except ValueError:
+        # only payloads that actually hold NaN/Infinity pay for the extra pass
+        return json.dumps(_finite_or_null(data), default=_json_default, separators=(",", ":")).encode()
+
+def _msgpack_default(value):
+    if isinstance(value, array):
+        if value.typecode != "d":
+            value = array("d", value)
+        if sys.byteorder == "big":
+            value = array("d", value)
+            value.byteswap()
+        return msgpack.ExtType(FLOAT64_ARRAY_EXT, value.tobytes())
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+def encode_msgpack(data) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(data, default=_msgpack_default)
+
+# === Negotiation ===
+
+def _negotiate_mimetype() -> str:
+    if msgpack is None:
+        return JSON_MIMETYPE
+    return request.accept_mimetypes.best_match([JSON_MIMETYPE, MSGPACK_MIMETYPE], default=JSON_MIMETYPE)
+
+def _negotiate_encoding() -> str | None:
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=4)
+    return gzip.compress(body, compresslevel=6)
+
+def _streaming_compressor(encoding: str | None):
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=4)
+        return compressor.process, compressor.finish
+    if encoding == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) # wbits=31 writes a gzip header
+        return compressor.compress, compressor.flush
+    return (lambda chunk: chunk), (lambda: b"")
+
+# === Responses ===
+
+def send_payload(data, status: int = 200) -> Response:
+    """Encode data as JSON or MessagePack (per the Accept header) and
+    compress it when the body is over COMPRESS_MIN_SIZE bytes."""
+    mimetype = _negotiate_mimetype()
+    body = encode_msgpack(data) if mimetype == MSGPACK_MIMETYPE else encode_json(data)
+
+    response = Response(body, status=status, mimetype=mimetype)
+    response.vary.update(("Accept", "Accept-Encoding"))
+
+    encoding = _negotiate_encoding()
+    if encoding and len(body) >= current_app.config.get("COMPRESS_MIN_SIZE", 1024):
+        response.set_data(compress(body, encoding))
+        response.headers["Content-Encoding"] = encoding
+
+    return response
+
+def stream_json_array(items, status: int = 200) -> Response:
+    """Stream a JSON array STREAM_CHUNK_SIZE items at a time so large
+    series never have to be encoded into one big buffer."""
+    chunk_size = current_app.config.get("STREAM_CHUNK_SIZE", 500)
+    encoding = _negotiate_encoding()
+
+    def generate():
+        process, finish = _streaming_compressor(encoding)
+        yield process(b"[")
+
+        chunk = []
+        first = True
+        for item in items:
+            chunk.append(encode_json(item))
+            if len(chunk) == chunk_size:
+                yield process((b"" if first else b",") + b",".join(chunk))
+                chunk = []
+                first = False
+        if chunk:
+            yield process((b"" if first else b",") + b",".join(chunk))
+
+        yield process(b"]") + finish()
+
+    response = Response(stream_with_context(generate()), status=status, mimetype=JSON_MIMETYPE)
+    # send_array picks this or msgpack by Accept, so caches have to key on both
+    response.vary.update(("Accept", "Accept-Encoding"))
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+def send_array(items: list, status: int = 200) -> Response:
+    # small lists are cheaper to send in one go, JSON is the only format we stream
+    if len(items) > current_app.config.get("STREAM_CHUNK_SIZE", 500) and _negotiate_mimetype() == JSON_MIMETYPE:
+        return stream_json_array(items, status)
+    return send_payload(items, status)
@@ -0,0 +1,50 @@
+"""Print payload size and encode time for each API response format.
+
+python bench_serializers.py
+"""
+import math
+import timeit
+from array import array
+
+from app import serializers
+from app.serializers import compress, encode_json, encode_msgpack, float_series
+
+def stdlib_json(payload) -> bytes:
+    # encode_json with orjson switched off, the path used when it isn't installed
+    orjson, serializers.orjson = serializers.orjson, None
+    try:
+        return encode_json(payload)
+    finally:
+        serializers.orjson = orjson
+
+def benchmark(size: int = 20_000, repeat: int = 20):
+    prices = [100 + i * 0.01 for i in range(size)]
+    payload = {
+        "symbol": "AAPL",
+        "prices": float_series(prices),
+        "payoffs": float_series(math.sin(p) * 250 for p in prices),
+        "histogram": float_series(math.exp(-((p - 200) ** 2) / 2000) for p in prices),
+    }
+
+    encoders = {"json (stdlib)": lambda: stdlib_json(payload)}
+    if serializers.orjson is not None:
+        encoders["json (orjson)"] = lambda: encode_json(payload)
+    if serializers.msgpack is not None:
+        plain = {key: (value.tolist() if isinstance(value, array) else value) for key, value in payload.items()}
+        encoders["msgpack"] = lambda: encode_msgpack(plain)
+        encoders["msgpack (columnar)"] = lambda: encode_msgpack(payload)
+
+    compressors = {"identity": lambda body: body, "gzip": lambda body: compress(body, "gzip")}
+    if serializers.brotli is not None:
+        compressors["br"] = lambda body: compress(body, "br")
+
+    print(f"{'format':<20}{'encoding':<10}{'bytes':>12}{'encode ms':>12}{'total ms':>12}")
+    for name, encode in encoders.items():
+        encode_ms = timeit.timeit(encode, number=repeat) / repeat * 1000
+        body = encode()
+        for encoding, compressor in compressors.items():
+            total_ms = encode_ms + timeit.timeit(lambda: compressor(body), number=repeat) / repeat * 1000
+            print(f"{name:<20}{encoding:<10}{len(compressor(body)):>12}{encode_ms:>12.2f}{total_ms:>12.2f}")
+
+if __name__ == "__main__":
+    benchmark()
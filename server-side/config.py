@@ -3,7 +3,6 @@ from dotenv import load_dotenv
 basedir = os.path.abspath(os.path.dirname(__file__))
 
 def is_prod():
-  print(f"app environment: {os.environ.get("APP_ENV")}")
   return os.environ.get("APP_ENV") == "production"
 
 load_dotenv()
@@ -19,12 +18,21 @@ class Config:
   # encrypts the data at the server side
   SECRET_KEY = FLASK_SECRET
   FLASK_PORT = 5000
+
+  IS_PROD = is_prod()
   
   # Session Configuration
   SESSION_TYPE = "filesystem"
-  SESSION_COOKIE_SECURE =  True if is_prod() else False
-  SESSION_COOKIE_SAMESITE = 'None' if is_prod() else 'Lax'
+  SESSION_COOKIE_SECURE = IS_PROD
+  SESSION_COOKIE_SAMESITE = 'None' if IS_PROD else 'Lax'
   SESSION_COOKIE_HTTPONLY = True
   
+  # Websocket logging is very noisy, only turn it on when debugging sockets
+  SOCKETIO_LOGGER = os.environ.get("SOCKETIO_LOGGER") == "true"
+
+  # API responses
+  COMPRESS_MIN_SIZE = 1024 # bytes, smaller bodies are sent uncompressed
+  STREAM_CHUNK_SIZE = 500 # array items encoded per streamed chunk
+
   # SECRET_KEY = os.environ.get("SECRET_KEY") or ""
   SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///' + os.path.join(basedir, 'app.db')
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# make `app` and `config` importable no matter where pytest is run from
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SERVER_DIR)
@@ -0,0 +1,193 @@
+import gzip
+import json
+import struct
+
+import pytest
+
+from app import create_app, serializers
+from app.serializers import FLOAT64_ARRAY_EXT, encode_json, float_series, send_array, send_payload
+from config import Config
+
+class SerializerConfig(Config):
+    COMPRESS_MIN_SIZE = 256
+    STREAM_CHUNK_SIZE = 4
+
+@pytest.fixture(scope="module")
+def app():
+    return create_app(SerializerConfig)
+
+def decode(response):
+    body = response.get_data()
+    encoding = response.headers.get("Content-Encoding")
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "br":
+        body = pytest.importorskip("brotli").decompress(body)
+    if response.mimetype == "application/msgpack":
+        return pytest.importorskip("msgpack").unpackb(body)
+    return json.loads(body)
+
+# === encode_json ===
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serializers, "orjson", None)
+    return request.param
+
+def test_encode_json_is_the_same_for_every_backend(json_backend):
+    data = {
+        "histogram": {1: 3, 2: 5},
+        "payoffs": [float("nan"), 1.5, float("inf")],
+        "prices": float_series([float("-inf"), 2]),
+    }
+
+    assert encode_json(data) == b'{"histogram":{"1":3,"2":5},"payoffs":[null,1.5,null],"prices":[null,2.0]}'
+
+# === send_payload ===
+
+def test_payload_below_threshold_is_not_compressed(app):
+    data = {"symbol": "AAPL"}
+    with app.test_request_context(headers={"Accept-Encoding": "br, gzip"}):
+        response = send_payload(data)
+
+        assert "Content-Encoding" not in response.headers
+        assert decode(response) == data
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", "gzip"),
+    ("br", "br"),
+    ("gzip, br", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("identity", None),
+])
+def test_payload_above_threshold_negotiates_encoding(app, accept_encoding, expected):
+    if expected == "br":
+        pytest.importorskip("brotli")
+
+    data = {"prices": list(range(200))}
+    with app.test_request_context(headers={"Accept-Encoding": accept_encoding}):
+        response = send_payload(data)
+
+        assert response.headers.get("Content-Encoding") == expected
+        assert set(response.vary) >= {"Accept", "Accept-Encoding"}
+        assert decode(response) == data
+
+def test_payload_negotiates_msgpack(app):
+    pytest.importorskip("msgpack")
+
+    data = {"name": "straddle", "legs": [{"strike": 100}]}
+    with app.test_request_context(headers={"Accept": "application/msgpack"}):
+        response = send_payload(data, 201)
+
+        assert response.status_code == 201
+        assert response.mimetype == "application/msgpack"
+        assert decode(response) == data
+
+def test_float_series_packs_as_float64_ext(app):
+    msgpack = pytest.importorskip("msgpack")
+
+    values = [100.0, 100.5, -2.25]
+    with app.test_request_context(headers={"Accept": "application/msgpack"}):
+        response = send_payload({"prices": float_series(values)})
+
+        ext = msgpack.unpackb(response.get_data())["prices"]
+
+    assert ext.code == FLOAT64_ARRAY_EXT
+    assert list(struct.unpack(f"<{len(values)}d", ext.data)) == values
+
+def test_float_series_is_a_plain_list_in_json(app):
+    with app.test_request_context():
+        response = send_payload({"prices": float_series([1, 2.5])})
+
+        assert decode(response) == {"prices": [1.0, 2.5]}
+
+# === send_array ===
+
+@pytest.mark.parametrize("size, streamed", [
+    (0, False),
+    (SerializerConfig.STREAM_CHUNK_SIZE, False),
+    (SerializerConfig.STREAM_CHUNK_SIZE + 1, True),
+    (SerializerConfig.STREAM_CHUNK_SIZE * 3, True),
+])
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip", "br"])
+def test_send_array_round_trips(app, size, streamed, accept_encoding):
+    if accept_encoding == "br":
+        pytest.importorskip("brotli")
+
+    items = [{"id": i, "name": f"strategy {i}"} for i in range(size)]
+    with app.test_request_context(headers={"Accept-Encoding": accept_encoding}):
+        response = send_array(items)
+
+        assert response.is_streamed == streamed
+        assert set(response.vary) >= {"Accept", "Accept-Encoding"}
+        assert decode(response) == items
+
+def test_send_array_does_not_stream_msgpack(app):
+    pytest.importorskip("msgpack")
+
+    items = list(range(SerializerConfig.STREAM_CHUNK_SIZE * 2))
+    with app.test_request_context(headers={"Accept": "application/msgpack"}):
+        response = send_array(items)
+
+        assert not response.is_streamed
+        assert decode(response) == items
+
+# === Fallbacks without the optional libraries ===
+
+def test_without_msgpack_negotiates_json(app, monkeypatch):
+    monkeypatch.setattr(serializers, "msgpack", None)
+
+    data = {"prices": float_series([1.5, 2.5])}
+    with app.test_request_context(headers={"Accept": "application/msgpack"}):
+        response = send_payload(data)
+
+        assert response.mimetype == "application/json"
+        assert decode(response) == {"prices": [1.5, 2.5]}
+
+def test_without_msgpack_streams_large_arrays(app, monkeypatch):
+    monkeypatch.setattr(serializers, "msgpack", None)
+
+    items = list(range(SerializerConfig.STREAM_CHUNK_SIZE * 2))
+    with app.test_request_context(headers={"Accept": "application/msgpack"}):
+        response = send_array(items)
+
+        assert response.is_streamed
+        assert decode(response) == items
+
+def test_encode_msgpack_without_msgpack_raises(monkeypatch):
+    monkeypatch.setattr(serializers, "msgpack", None)
+
+    with pytest.raises(RuntimeError):
+        serializers.encode_msgpack({})
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("br, gzip", "gzip"),
+    ("br", None),
+])
+def test_without_brotli_falls_back_to_gzip(app, monkeypatch, accept_encoding, expected):
+    monkeypatch.setattr(serializers, "brotli", None)
+
+    data = {"prices": list(range(200))}
+    with app.test_request_context(headers={"Accept-Encoding": accept_encoding}):
+        payload_response = send_payload(data)
+        array_response = send_array(data["prices"])
+
+        for response in (payload_response, array_response):
+            assert response.headers.get("Content-Encoding") == expected
+        assert decode(payload_response) == data
+        assert decode(array_response) == data["prices"]
+
+def test_without_any_speedups(app, monkeypatch):
+    for name in ("orjson", "msgpack", "brotli"):
+        monkeypatch.setattr(serializers, name, None)
+
+    data = {"histogram": {1: float("nan")}, "prices": list(range(200))}
+    with app.test_request_context(headers={"Accept": "application/msgpack", "Accept-Encoding": "br, gzip"}):
+        response = send_payload(data)
+
+        assert response.mimetype == "application/json"
+        assert response.headers.get("Content-Encoding") == "gzip"
+        assert decode(response) == {"histogram": {"1": None}, "prices": list(range(200))}
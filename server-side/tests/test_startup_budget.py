@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Startup budgets in seconds
+IMPORT_TIME_BUDGET = float(os.environ.get("IMPORT_TIME_BUDGET") or 2.0)
+FIRST_REQUEST_BUDGET = float(os.environ.get("FIRST_REQUEST_BUDGET") or 1.0)
+
+LAZY_MODULES = ["authlib.integrations.flask_client", "finnhub"]
+
+# Runs in a fresh interpreter so nothing imported by other tests can hide a slow startup
+FIRST_REQUEST_SCRIPT = """
+import json, time
+import app
+
+start = time.perf_counter()
+flask_app = app.create_app()
+response = flask_app.test_client().get("/api/get-price")
+print(json.dumps({"elapsed": time.perf_counter() - start, "status": response.status_code}))
+"""
+
+def run_python(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], cwd=SERVER_DIR, capture_output=True, text=True, check=True)
+    return result.stdout
+
+def test_cold_import_is_within_budget():
+    start = time.perf_counter()
+    output = run_python(f"import sys, app; print([m for m in {LAZY_MODULES!r} if m in sys.modules])")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < IMPORT_TIME_BUDGET, f"cold import took {elapsed:.2f}s"
+    # these are only needed on first login / first price lookup
+    assert output.strip() == "[]"
+
+def test_first_request_is_within_budget():
+    result = json.loads(run_python(FIRST_REQUEST_SCRIPT).strip().splitlines()[-1])
+
+    assert result["status"] == 400
+    assert result["elapsed"] < FIRST_REQUEST_BUDGET, f"create_app and first request took {result['elapsed']:.2f}s"